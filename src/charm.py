@@ -7,6 +7,7 @@
 """A Juju charm for Ory Hydra."""
 
 import logging
+from functools import cached_property
 from secrets import token_hex
 from typing import Any
 
@@ -58,7 +59,7 @@ from constants import (
     COOKIE_SECRET_KEY,
     COOKIE_SECRET_LABEL,
     DATABASE_INTEGRATION_NAME,
-    DEFAULT_OAUTH_SCOPES,
+    DEFAULT_OAUTH_SCOPES_STR,
     GRAFANA_DASHBOARD_INTEGRATION_NAME,
     INTERNAL_INGRESS_INTEGRATION_NAME,
     LOGGING_RELATION_NAME,
@@ -102,9 +103,6 @@ class HydraCharm(CharmBase):
         self.charm_config = CharmConfig(self.config)
 
         self._container = self.unit.get_container(WORKLOAD_CONTAINER)
-        self._workload_service = WorkloadService(self.unit)
-        self._pebble_service = PebbleService(self.unit)
-        self._cli = CommandLine(self._container)
 
         self.database_requirer = DatabaseRequires(
             self,
@@ -259,6 +257,18 @@ class HydraCharm(CharmBase):
         )
         self.framework.observe(self.on.rotate_key_action, self._on_rotate_key_action)
 
+    @cached_property
+    def _workload_service(self) -> WorkloadService:
+        return WorkloadService(self.unit)
+
+    @cached_property
+    def _pebble_service(self) -> PebbleService:
+        return PebbleService(self.unit)
+
+    @cached_property
+    def _cli(self) -> CommandLine:
+        return CommandLine(self._container)
+
     @property
     def _pebble_layer(self) -> Layer:
         tracing_data = TracingData.load(self.tracing_requirer)
@@ -348,15 +358,15 @@ class HydraCharm(CharmBase):
             event.defer()
             return
 
+        database_config = DatabaseConfig.load(self.database_requirer)
         try:
-            self._cli.migrate(DatabaseConfig.load(self.database_requirer).dsn)
+            self._cli.migrate(database_config.dsn)
         except MigrationError:
             self.unit.status = BlockedStatus("Database migration failed")
             logger.error("Auto migration job failed. Please use the run-migration action")
             return
 
-        migration_version = DatabaseConfig.load(self.database_requirer).migration_version
-        self.peer_data[migration_version] = self._workload_service.version
+        self.peer_data[database_config.migration_version] = self._workload_service.version
         self._holistic_handler(event)
 
     def _on_database_changed(self, event: DatabaseEndpointsChangedEvent) -> None:
@@ -381,7 +391,7 @@ class HydraCharm(CharmBase):
             ),
             userinfo_endpoint=str(public_url / "userinfo"),
             jwks_endpoint=str(public_url / ".well-known/jwks.json"),
-            scope=" ".join(DEFAULT_OAUTH_SCOPES),
+            scope=DEFAULT_OAUTH_SCOPES_STR,
             jwt_access_token=self.config.get("jwt_access_tokens", True),
         )
 
@@ -497,7 +507,8 @@ class HydraCharm(CharmBase):
             event.defer()
             return
 
-        self._pebble_service.push_config_file(
+        pebble_layer = self._pebble_layer
+        config_changed = self._pebble_service.push_config_file(
             ConfigFile.from_sources(
                 self.secrets,
                 self.charm_config,
@@ -508,7 +519,10 @@ class HydraCharm(CharmBase):
         )
 
         try:
-            self._pebble_service.plan(self._pebble_layer)
+            self._pebble_service.plan(
+                pebble_layer,
+                restart=config_changed or not self._workload_service.is_running,
+            )
         except PebbleServiceError:
             logger.error("Failed to start the service, please check the container logs")
             self.unit.status = BlockedStatus(
@@ -530,16 +544,16 @@ class HydraCharm(CharmBase):
         event.log("Start migrating the database")
 
         timeout = float(event.params.get("timeout", 120))
+        database_config = DatabaseConfig.load(self.database_requirer)
         try:
-            self._cli.migrate(dsn=DatabaseConfig.load(self.database_requirer).dsn, timeout=timeout)
+            self._cli.migrate(dsn=database_config.dsn, timeout=timeout)
         except MigrationError as err:
             event.fail(f"Database migration failed: {err}")
             return
         else:
             event.log("Successfully migrated the database")
 
-        migration_version = DatabaseConfig.load(self.database_requirer).migration_version
-        self.peer_data[migration_version] = self._workload_service.version
+        self.peer_data[database_config.migration_version] = self._workload_service.version
         event.log("Successfully updated migration version")
 
         self._holistic_handler(event)
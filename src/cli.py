@@ -9,7 +9,14 @@ from typing import Any, Optional
 
 from ops import Container
 from ops.pebble import Error, ExecError
-from pydantic import AliasChoices, BaseModel, Field, field_serializer, field_validator
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    Field,
+    TypeAdapter,
+    field_serializer,
+    field_validator,
+)
 
 from constants import ADMIN_PORT, CONFIG_FILE_NAME, DEFAULT_OAUTH_SCOPES, DEFAULT_RESPONSE_TYPES
 from exceptions import MigrationError
@@ -17,6 +24,8 @@ from exceptions import MigrationError
 logger = logging.getLogger(__name__)
 
 VERSION_REGEX = re.compile(r"Version:\s+(?P<version>v\d+\.\d+\.\d+)")
+RESOURCE_NOT_FOUND_MARKER = "Unable to locate the resource"
+ADMIN_API_OPTIONS = ("--endpoint", f"http://localhost:{ADMIN_PORT}", "--format", "json")
 
 
 class OAuthClient(BaseModel):
@@ -26,7 +35,7 @@ class OAuthClient(BaseModel):
         serialization_alias="redirect-uris",
     )
     response_types: list[str] = Field(
-        default=DEFAULT_RESPONSE_TYPES,
+        default_factory=lambda: list(DEFAULT_RESPONSE_TYPES),
         validation_alias=AliasChoices("response-types", "response_types"),
         serialization_alias="response-types",
     )
@@ -79,35 +88,31 @@ class OAuthClient(BaseModel):
         return scope.split()
 
     def to_cmd_options(self) -> list[str]:
-        cmd_options = []
-
-        cmd_options.extend(["--scope", self.scope])
-        cmd_options.extend(["--response-type", ",".join(self.response_types)])
-
-        if self.audience:
-            cmd_options.extend(["--audience", ",".join(self.audience)])
-
-        if self.grant_types:
-            cmd_options.extend(["--grant-type", ",".join(self.grant_types)])
-
-        if self.redirect_uris:
-            cmd_options.extend(["--redirect-uri", ",".join(self.redirect_uris)])
-
-        if self.client_secret:
-            cmd_options.extend(["--secret", self.client_secret])
-
-        if self.token_endpoint_auth_method:
-            cmd_options.extend(["--token-endpoint-auth-method", self.token_endpoint_auth_method])
+        optional_options = (
+            ("--audience", ",".join(self.audience or ())),
+            ("--grant-type", ",".join(self.grant_types or ())),
+            ("--redirect-uri", ",".join(self.redirect_uris or ())),
+            ("--secret", self.client_secret),
+            ("--token-endpoint-auth-method", self.token_endpoint_auth_method),
+            ("--metadata", json.dumps(self.metadata) if self.metadata else None),
+        )
+
+        return [
+            "--scope",
+            self.scope,
+            "--response-type",
+            ",".join(self.response_types),
+            *(arg for flag, value in optional_options if value for arg in (flag, value)),
+        ]
 
-        if self.metadata:
-            cmd_options.extend(["--metadata", json.dumps(self.metadata)])
 
-        return cmd_options
+OAUTH_CLIENTS_ADAPTER = TypeAdapter(list[OAuthClient])
 
 
 class CommandLine:
     def __init__(self, container: Container):
         self.container = container
+        self._version: Optional[str] = None
 
     def get_hydra_service_version(self) -> Optional[str]:
         """Get Hydra application version.
@@ -116,7 +121,13 @@ class CommandLine:
         Version:    {version}
         Git Hash:   {hash}
         Build Time: {time}
+
+        The version is fixed for the lifetime of the workload container, so
+        it is only fetched once.
         """
+        if self._version:
+            return self._version
+
         cmd = ["hydra", "version"]
         try:
             stdout = self._run_cmd(cmd)
@@ -125,7 +136,8 @@ class CommandLine:
             return None
 
         matched = VERSION_REGEX.search(stdout)
-        return matched.group("version") if matched else None
+        self._version = matched.group("version") if matched else None
+        return self._version
 
     def migrate(self, dsn: Optional[str] = None, timeout: float = 60) -> None:
         """Apply Hydra migration plan.
@@ -156,10 +168,7 @@ class CommandLine:
             "create",
             "jwk",
             key_set_id,
-            "--endpoint",
-            f"http://localhost:{ADMIN_PORT}",
-            "--format",
-            "json",
+            *ADMIN_API_OPTIONS,
             "--alg",
             algorithm,
         ]
@@ -173,29 +182,39 @@ class CommandLine:
         res = json.loads(stdout)
         return res["keys"][0]["kid"]
 
-    def list_oauth_clients(self) -> list[OAuthClient]:
+    def list_oauth_clients(self, page_size: int = 500) -> list[OAuthClient]:
         """List OAuth 2.0 clients.
 
+        The clients are fetched page by page, so that each command output
+        stays bounded no matter how many clients are registered.
+
         More information: https://www.ory.sh/docs/hydra/cli/hydra-list-clients
         """
         cmd = [
             "hydra",
             "list",
             "clients",
-            "--endpoint",
-            f"http://localhost:{ADMIN_PORT}",
-            "--format",
-            "json",
+            *ADMIN_API_OPTIONS,
+            "--page-size",
+            str(page_size),
         ]
 
-        try:
-            stdout = self._run_cmd(cmd)
-        except Error as err:
-            logger.error("Failed to list all OAuth clients: %s", err)
-            return []
+        clients: list[OAuthClient] = []
+        page_token = None
+        while True:
+            page_cmd = cmd + ["--page-token", page_token] if page_token else cmd
+            try:
+                stdout = self._run_cmd(page_cmd)
+            except Error as err:
+                logger.error("Failed to list all OAuth clients: %s", err)
+                return []
+
+            page = json.loads(stdout)
+            clients.extend(OAUTH_CLIENTS_ADAPTER.validate_python(page["items"]))
 
-        clients = json.loads(stdout)["items"]
-        return [OAuthClient(**c) for c in clients]
+            page_token = page.get("next_page_token")
+            if not page_token or page.get("is_last_page", True):
+                return clients
 
     def get_oauth_client(self, client_id: str) -> Optional[OAuthClient]:
         """Get an OAuth 2.0 client by client id.
@@ -207,17 +226,14 @@ class CommandLine:
             "get",
             "client",
             client_id,
-            "--endpoint",
-            f"http://localhost:{ADMIN_PORT}",
-            "--format",
-            "json",
+            *ADMIN_API_OPTIONS,
         ]
 
         try:
             stdout = self._run_cmd(cmd)
         except Error as err:
             logger.error("Failed to get the OAuth client: %s", err)
-            if "Unable to locate the resource" in str(err):
+            if RESOURCE_NOT_FOUND_MARKER in str(err):
                 logger.error("OAuth client not found: %s", client_id)
             return None
 
@@ -234,10 +250,7 @@ class CommandLine:
             "hydra",
             "create",
             "client",
-            "--endpoint",
-            f"http://localhost:{ADMIN_PORT}",
-            "--format",
-            "json",
+            *ADMIN_API_OPTIONS,
         ]
 
         try:
@@ -260,10 +273,7 @@ class CommandLine:
             "update",
             "client",
             client.client_id,
-            "--endpoint",
-            f"http://localhost:{ADMIN_PORT}",
-            "--format",
-            "json",
+            *ADMIN_API_OPTIONS,
         ]
 
         try:
@@ -284,10 +294,7 @@ class CommandLine:
             "delete",
             "client",
             client_id,
-            "--endpoint",
-            f"http://localhost:{ADMIN_PORT}",
-            "--format",
-            "json",
+            *ADMIN_API_OPTIONS,
         ]
 
         try:
@@ -308,10 +315,7 @@ class CommandLine:
             "delete",
             "access-tokens",
             client_id,
-            "--endpoint",
-            f"http://localhost:{ADMIN_PORT}",
-            "--format",
-            "json",
+            *ADMIN_API_OPTIONS,
         ]
 
         try:
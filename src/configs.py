@@ -1,17 +1,35 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from collections import ChainMap
+import logging
 from typing import Any, Mapping, Protocol, TypeAlias
 
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from ops import ConfigData
 
 from constants import DEFAULT_OAUTH_SCOPES
 
+logger = logging.getLogger(__name__)
+
 ServiceConfigs: TypeAlias = Mapping[str, Any]
 
 
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logger.warning("Template bytecode cache is disabled: %s", e)
+        return None
+
+
+# The bytecode cache lets a new hook process skip compiling the template source again
+JINJA_ENV = Environment(
+    loader=FileSystemLoader("templates"),
+    bytecode_cache=_bytecode_cache(),
+    auto_reload=False,
+)
+
+
 class ServiceConfigSource(Protocol):
     """An interface enforcing the contribution to workload service configs."""
 
@@ -22,6 +40,8 @@ class ServiceConfigSource(Protocol):
 class CharmConfig:
     """A class representing the data source of charm configurations."""
 
+    __slots__ = ("_config",)
+
     def __init__(self, config: ConfigData) -> None:
         self._config = config
 
@@ -38,13 +58,12 @@ class ConfigFile:
 
     @classmethod
     def from_sources(cls, *service_config_sources: ServiceConfigSource) -> str:
-        with open("templates/hydra.yaml.j2", "r") as file:
-            template = Template(file.read())
+        template = JINJA_ENV.get_template("hydra.yaml.j2")
 
-        configs = {
-            **{"supported_scopes": DEFAULT_OAUTH_SCOPES},
-            **ChainMap(*(source.to_service_configs() for source in service_config_sources)),  # type: ignore
-        }
+        configs: dict[str, Any] = {"supported_scopes": list(DEFAULT_OAUTH_SCOPES)}
+        # Earlier sources take precedence over later ones
+        for source in reversed(service_config_sources):
+            configs.update(source.to_service_configs())
         rendered = template.render(configs)
 
         return rendered
@@ -1,18 +1,17 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from string import Template
-
 # Charm constants
-POSTGRESQL_DSN_TEMPLATE = Template("postgres://$username:$password@$endpoint/$database")
+POSTGRESQL_DSN_FORMAT = "postgres://{username}:{password}@{endpoint}/{database}"
 WORKLOAD_CONTAINER = "hydra"
 WORKLOAD_SERVICE = "hydra"
 COOKIE_SECRET_KEY = "cookie"
 SYSTEM_SECRET_KEY = "system"
 COOKIE_SECRET_LABEL = "cookiesecret"
 SYSTEM_SECRET_LABEL = "systemsecret"
-DEFAULT_OAUTH_SCOPES = ["openid", "profile", "email", "phone"]
-DEFAULT_RESPONSE_TYPES = ["code"]
+DEFAULT_OAUTH_SCOPES = ("openid", "profile", "email", "phone")
+DEFAULT_OAUTH_SCOPES_STR = " ".join(DEFAULT_OAUTH_SCOPES)
+DEFAULT_RESPONSE_TYPES = ("code",)
 
 # Application constants
 HYDRA_SERVICE_COMMAND = "hydra serve all"
@@ -3,11 +3,9 @@
 
 import json
 import logging
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from typing import Any, KeysView, Type, TypeAlias, Union
-from urllib.parse import urlparse
 
-import dacite
 from charms.data_platform_libs.v0.data_interfaces import DatabaseRequires
 from charms.identity_platform_login_ui_operator.v0.login_ui_endpoints import (
     LoginUIEndpointsRequirer,
@@ -15,12 +13,11 @@ from charms.identity_platform_login_ui_operator.v0.login_ui_endpoints import (
 from charms.tempo_k8s.v2.tracing import TracingEndpointRequirer
 from charms.traefik_k8s.v2.ingress import IngressPerAppRequirer
 from charms.traefik_route_k8s.v0.traefik_route import TraefikRouteRequirer
-from jinja2 import Template
 from ops.model import Model
 from yarl import URL
 
-from configs import ServiceConfigs
-from constants import ADMIN_PORT, PEER_INTEGRATION_NAME, POSTGRESQL_DSN_TEMPLATE, PUBLIC_PORT
+from configs import JINJA_ENV, ServiceConfigs
+from constants import ADMIN_PORT, PEER_INTEGRATION_NAME, POSTGRESQL_DSN_FORMAT, PUBLIC_PORT
 from env_vars import EnvVars
 
 logger = logging.getLogger(__name__)
@@ -44,7 +41,11 @@ class PeerData:
         if not (peers := self._model.get_relation(PEER_INTEGRATION_NAME)):
             return
 
-        peers.data[self._app][key] = json.dumps(value)
+        # A canonical encoding lets unchanged values skip the write, which
+        # would otherwise trigger a relation-changed event on every peer
+        data = json.dumps(value, sort_keys=True)
+        if peers.data[self._app].get(key) != data:
+            peers.data[self._app][key] = data
 
     def pop(self, key: str) -> JsonSerializable:
         if not (peers := self._model.get_relation(PEER_INTEGRATION_NAME)):
@@ -72,7 +73,7 @@ class DatabaseConfig:
 
     @property
     def dsn(self) -> str:
-        return POSTGRESQL_DSN_TEMPLATE.substitute(
+        return POSTGRESQL_DSN_FORMAT.format(
             username=self.username,
             password=self.password,
             endpoint=self.endpoint,
@@ -90,7 +91,9 @@ class DatabaseConfig:
             return cls()
 
         integration_id = database_integrations[0].id
-        integration_data: dict[str, str] = requirer.fetch_relation_data()[integration_id]
+        integration_data: dict[str, str] = requirer.fetch_relation_data(
+            relation_ids=[integration_id]
+        )[integration_id]
 
         return cls(
             endpoint=integration_data.get("endpoints", "").split(",")[0],
@@ -125,11 +128,11 @@ class TracingData:
         if not (is_ready := requirer.is_ready()):
             return cls()
 
-        http_endpoint = urlparse(requirer.get_endpoint("otlp_http"))
+        http_endpoint = requirer.get_endpoint("otlp_http")
 
         return cls(
             is_ready=is_ready,
-            http_endpoint=http_endpoint.geturl().replace(f"{http_endpoint.scheme}://", "", 1),  # type: ignore[arg-type]
+            http_endpoint=http_endpoint.split("://", 1)[-1],  # type: ignore[union-attr]
         )
 
 
@@ -154,7 +157,14 @@ class LoginUIEndpointData:
             logger.error("Failed to fetch the login ui endpoints: %s", exc)
             return cls()
 
-        return dacite.from_dict(data_class=LoginUIEndpointData, data=login_ui_endpoints)
+        return cls(**{
+            key: login_ui_endpoints[key]
+            for key in LOGIN_UI_ENDPOINT_KEYS
+            if key in login_ui_endpoints
+        })
+
+
+LOGIN_UI_ENDPOINT_KEYS = tuple(endpoint.name for endpoint in fields(LoginUIEndpointData))
 
 
 @dataclass(frozen=True, slots=True)
@@ -183,11 +193,8 @@ class InternalIngressData:
     def load(cls, requirer: TraefikRouteRequirer) -> "InternalIngressData":
         model, app = requirer._charm.model.name, requirer._charm.app.name
         external_host = requirer.external_host
-        external_endpoint = f"{requirer.scheme}://{external_host}/{model}-{app}"
-
-        with open("templates/ingress.json.j2", "r") as file:
-            template = Template(file.read())
 
+        template = JINJA_ENV.get_template("ingress.json.j2")
         ingress_config = json.loads(
             template.render(
                 model=model,
@@ -198,16 +205,14 @@ class InternalIngressData:
             )
         )
 
-        public_endpoint = URL(
-            external_endpoint
-            if external_host
-            else f"http://{app}.{model}.svc.cluster.local:{PUBLIC_PORT}"
-        )
-        admin_endpoint = URL(
-            external_endpoint
-            if external_host
-            else f"http://{app}.{model}.svc.cluster.local:{ADMIN_PORT}"
-        )
+        if external_host:
+            public_endpoint = admin_endpoint = URL(
+                f"{requirer.scheme}://{external_host}/{model}-{app}"
+            )
+        else:
+            service_host = f"{app}.{model}.svc.cluster.local"
+            public_endpoint = URL.build(scheme="http", host=service_host, port=PUBLIC_PORT)
+            admin_endpoint = URL.build(scheme="http", host=service_host, port=ADMIN_PORT)
 
         return cls(
             public_endpoint=public_endpoint,
@@ -43,12 +43,10 @@ class Secrets:
     def values(self) -> ValuesView:
         secret_contents = {}
         for key, label in zip(self.KEYS, self.LABELS):
-            try:
-                secret = self._model.get_secret(label=label)
-            except SecretNotFoundError:
+            if (content := self[label]) is None:
                 return ValuesView({})
-            else:
-                secret_contents[key] = secret.get_content()
+
+            secret_contents[key] = content
 
         return secret_contents.values()
 
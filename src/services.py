@@ -2,11 +2,11 @@
 # See LICENSE file for licensing details.
 
 import logging
-from collections import ChainMap
 from pathlib import PurePath
 
 from ops.model import Container, ModelError, Unit
-from ops.pebble import Layer, LayerDict
+from ops.pebble import ConnectionError as PebbleConnectionError
+from ops.pebble import Layer, LayerDict, PathError
 
 from cli import CommandLine
 from constants import (
@@ -22,7 +22,7 @@ from exceptions import PebbleServiceError
 
 logger = logging.getLogger(__name__)
 
-PEBBLE_LAYER_DICT = {
+PEBBLE_LAYER_DICT: LayerDict = {
     "summary": "hydra-operator layer",
     "description": "pebble config layer for hydra-operator",
     "services": {
@@ -74,7 +74,7 @@ class WorkloadService:
     def is_running(self) -> bool:
         try:
             workload_service = self._container.get_service(WORKLOAD_CONTAINER)
-        except ModelError:
+        except (ModelError, PebbleConnectionError):
             return False
 
         return workload_service.is_running()
@@ -98,23 +98,47 @@ class PebbleService:
 
         self._container.make_dir(path=path, make_parents=True)
 
-    def push_config_file(self, content: str) -> None:
-        self._container.push(CONFIG_FILE_NAME, content, make_dirs=True)
+    def push_config_file(self, content: str) -> bool:
+        """Push the config file and return whether its content changed."""
+        try:
+            with self._container.pull(CONFIG_FILE_NAME) as config_file:
+                current_content = config_file.read()
+        except PathError:
+            current_content = None
 
-    def plan(self, layer: Layer) -> None:
-        self._container.add_layer(WORKLOAD_CONTAINER, layer, combine=True)
+        if current_content == content:
+            return False
+
+        self._container.push(CONFIG_FILE_NAME, content, make_dirs=True)
+        return True
 
+    def plan(self, layer: Layer, restart: bool = True) -> None:
         try:
-            self._container.restart(WORKLOAD_CONTAINER)
+            self._container.add_layer(WORKLOAD_CONTAINER, layer, combine=True)
+            if restart:
+                self._container.restart(WORKLOAD_CONTAINER)
+            else:
+                # Only restarts the workload service if its layer changed
+                self._container.replan()
         except Exception as e:
+            # The pushed config file is what marks the config as applied, so
+            # drop it to have the next hook push it again and retry the restart
+            self._remove_config_file()
             raise PebbleServiceError(f"Pebble failed to restart the workload service. Error: {e}")
 
+    def _remove_config_file(self) -> None:
+        try:
+            self._container.remove_path(CONFIG_FILE_NAME, recursive=True)
+        except Exception as e:
+            logger.error("Failed to remove the config file: %s", e)
+
     def render_pebble_layer(self, *env_var_sources: EnvVarConvertible) -> Layer:
-        updated_env_vars = ChainMap(*(source.to_env_vars() for source in env_var_sources))  # type: ignore
-        env_vars = {
-            **DEFAULT_CONTAINER_ENV,
-            **updated_env_vars,
-        }
-        self._layer_dict["services"][WORKLOAD_SERVICE]["environment"] = env_vars
+        env_vars: dict[str, str | bool] = dict(DEFAULT_CONTAINER_ENV)
+        # Earlier sources take precedence over later ones
+        for source in reversed(env_var_sources):
+            env_vars.update(source.to_env_vars())
+
+        # The static layer skeleton is shared, only the environment differs per render
+        service = {**self._layer_dict["services"][WORKLOAD_SERVICE], "environment": env_vars}
 
-        return Layer(self._layer_dict)
+        return Layer({**self._layer_dict, "services": {WORKLOAD_SERVICE: service}})  # type: ignore[arg-type]
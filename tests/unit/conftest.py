@@ -5,12 +5,14 @@ from typing import Generator
 from unittest.mock import MagicMock, PropertyMock, create_autospec
 
 import pytest
+from jinja2 import DictLoader, Environment
 from ops import Container, EventBase, Unit
 from ops.testing import Harness
 from pytest_mock import MockerFixture
 from yarl import URL
 
 from charm import HydraCharm
+from configs import JINJA_ENV
 from constants import (
     DATABASE_INTEGRATION_NAME,
     OAUTH_INTEGRATION_NAME,
@@ -38,6 +40,18 @@ def mocked_event() -> MagicMock:
     return create_autospec(EventBase)
 
 
+@pytest.fixture
+def mocked_templates() -> dict[str, str]:
+    return {}
+
+
+@pytest.fixture
+def mocked_jinja_env(mocker: MockerFixture, mocked_templates: dict[str, str]) -> Environment:
+    mocker.patch.object(JINJA_ENV, "loader", DictLoader(mocked_templates))
+    mocker.patch.object(JINJA_ENV, "bytecode_cache", None)
+    return JINJA_ENV
+
+
 @pytest.fixture
 def harness() -> Generator[Harness, None, None]:
     harness = Harness(HydraCharm)
@@ -1,7 +1,7 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from unittest.mock import MagicMock, PropertyMock, call, patch
+from unittest.mock import ANY, MagicMock, PropertyMock, call, patch
 
 import pytest
 from ops import ActiveStatus, BlockedStatus, WaitingStatus
@@ -715,3 +715,20 @@ class TestHolisticHandler:
         mocked_pebble_service.push_config_file.assert_called_once()
         mocked_pebble_service.plan.assert_called_once()
         assert harness.charm.unit.status == ActiveStatus()
+
+    def test_when_config_unchanged(
+        self,
+        harness: Harness,
+        mocked_event: MagicMock,
+        mocked_pebble_service: MagicMock,
+        mocked_workload_service: MagicMock,
+        mocked_public_ingress_data: MagicMock,
+    ) -> None:
+        mocked_pebble_service.push_config_file.return_value = False
+        mocked_workload_service.is_running = True
+
+        with patch("charm.ConfigFile.from_sources", return_value="config"):
+            harness.charm._holistic_handler(mocked_event)
+
+        mocked_pebble_service.plan.assert_called_once_with(ANY, restart=False)
+        assert harness.charm.unit.status == ActiveStatus()
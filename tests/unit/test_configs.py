@@ -1,14 +1,25 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock
 
 import pytest
+from jinja2 import Environment
 from ops.testing import Harness
+from pytest_mock import MockerFixture
 
-from configs import CharmConfig, ConfigFile, ServiceConfigSource
+from configs import CharmConfig, ConfigFile, ServiceConfigSource, _bytecode_cache
 from constants import DEFAULT_OAUTH_SCOPES
 
 
+@pytest.mark.parametrize("error", [OSError, RuntimeError])
+def test_bytecode_cache_when_cache_directory_unavailable(
+    mocker: MockerFixture, error: type[Exception]
+) -> None:
+    mocker.patch("configs.FileSystemBytecodeCache", side_effect=error)
+
+    assert _bytecode_cache() is None
+
+
 class TestCharmConfig:
     @pytest.mark.parametrize(
         "config, expected",
@@ -30,19 +41,42 @@ class TestCharmConfig:
         assert actual == expected
 
 
+@pytest.mark.usefixtures("mocked_jinja_env")
 class TestConfigFile:
     @pytest.fixture
-    def config_template(self) -> str:
-        return "{{ supported_scopes }} and {{ key1 }} and {{ key2 }}"
+    def mocked_templates(self) -> dict[str, str]:
+        return {"hydra.yaml.j2": "{{ supported_scopes }} and {{ key1 }} and {{ key2 }}"}
 
-    def test_from_sources(self, config_template: str) -> None:
+    def test_from_sources(self) -> None:
         source = MagicMock(spec=ServiceConfigSource)
         source.to_service_configs.return_value = {"key1": "value1"}
 
         another_source = MagicMock(spec=ServiceConfigSource)
         another_source.to_service_configs.return_value = {"key2": "value2"}
 
-        with patch("builtins.open", mock_open(read_data=config_template)):
-            config_file = ConfigFile.from_sources(source, another_source)
+        config_file = ConfigFile.from_sources(source, another_source)
+
+        assert config_file == f"{list(DEFAULT_OAUTH_SCOPES)} and value1 and value2"
+
+    def test_from_sources_loads_template_once(
+        self, mocker: MockerFixture, mocked_jinja_env: Environment
+    ) -> None:
+        source = MagicMock(spec=ServiceConfigSource)
+        source.to_service_configs.return_value = {"key1": "value1", "key2": "value2"}
+        get_source = mocker.spy(mocked_jinja_env.loader, "get_source")
+
+        ConfigFile.from_sources(source)
+        ConfigFile.from_sources(source)
+
+        get_source.assert_called_once_with(mocked_jinja_env, "hydra.yaml.j2")
+
+    def test_from_sources_with_overlapping_keys(self) -> None:
+        source = MagicMock(spec=ServiceConfigSource)
+        source.to_service_configs.return_value = {"key1": "value1", "key2": "value2"}
+
+        another_source = MagicMock(spec=ServiceConfigSource)
+        another_source.to_service_configs.return_value = {"key2": "overridden"}
+
+        config_file = ConfigFile.from_sources(source, another_source)
 
-        assert config_file == f"{DEFAULT_OAUTH_SCOPES} and value1 and value2"
+        assert config_file == f"{list(DEFAULT_OAUTH_SCOPES)} and value1 and value2"
@@ -1,11 +1,15 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+from io import StringIO
 from typing import Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
 from ops import ModelError
+from ops.pebble import ConnectionError as PebbleConnectionError
+from ops.pebble import Layer, PathError
+from ops.testing import Harness
 
 from constants import (
     ADMIN_PORT,
@@ -16,7 +20,7 @@ from constants import (
 )
 from env_vars import DEFAULT_CONTAINER_ENV, EnvVarConvertible
 from exceptions import PebbleServiceError
-from services import PebbleService, WorkloadService
+from services import PEBBLE_LAYER_DICT, PebbleService, WorkloadService
 
 
 class TestWorkloadService:
@@ -71,10 +75,27 @@ class TestWorkloadService:
         assert is_running is True
         get_service.assert_called_once_with(WORKLOAD_CONTAINER)
 
-    def test_is_running_with_error(
+    def test_is_running_queries_pebble_each_time(
         self, mocked_container: MagicMock, workload_service: WorkloadService
     ) -> None:
-        with patch.object(mocked_container, "get_service", side_effect=ModelError):
+        mocked_service_info = MagicMock(is_running=MagicMock(side_effect=[True, False]))
+
+        with patch.object(
+            mocked_container, "get_service", return_value=mocked_service_info
+        ) as get_service:
+            assert workload_service.is_running is True
+            assert workload_service.is_running is False
+
+        assert get_service.call_count == 2
+
+    @pytest.mark.parametrize("error", [ModelError, PebbleConnectionError])
+    def test_is_running_with_error(
+        self,
+        mocked_container: MagicMock,
+        workload_service: WorkloadService,
+        error: type[Exception],
+    ) -> None:
+        with patch.object(mocked_container, "get_service", side_effect=error):
             is_running = workload_service.is_running
 
         assert is_running is False
@@ -96,11 +117,26 @@ class TestPebbleService:
         self, mocked_container: MagicMock, pebble_service: PebbleService
     ) -> None:
         config_file_content = "config"
-        pebble_service.push_config_file(config_file_content)
+        mocked_container.pull.side_effect = PathError("not-found", "file not found")
+
+        changed = pebble_service.push_config_file(config_file_content)
+
+        assert changed is True
         mocked_container.push.assert_called_once_with(
             CONFIG_FILE_NAME, config_file_content, make_dirs=True
         )
 
+    def test_push_unchanged_config_file(
+        self, mocked_container: MagicMock, pebble_service: PebbleService
+    ) -> None:
+        config_file_content = "config"
+        mocked_container.pull.return_value = StringIO(config_file_content)
+
+        changed = pebble_service.push_config_file(config_file_content)
+
+        assert changed is False
+        mocked_container.push.assert_not_called()
+
     @patch("ops.pebble.Layer")
     def test_plan(
         self,
@@ -115,6 +151,21 @@ class TestPebbleService:
         )
         mocked_container.restart.assert_called_once()
 
+    @patch("ops.pebble.Layer")
+    def test_plan_without_restart(
+        self,
+        mocked_layer: MagicMock,
+        mocked_container: MagicMock,
+        pebble_service: PebbleService,
+    ) -> None:
+        pebble_service.plan(mocked_layer, restart=False)
+
+        mocked_container.add_layer.assert_called_once_with(
+            WORKLOAD_CONTAINER, mocked_layer, combine=True
+        )
+        mocked_container.replan.assert_called_once()
+        mocked_container.restart.assert_not_called()
+
     @patch("ops.pebble.Layer")
     def test_plan_failure(
         self,
@@ -131,6 +182,53 @@ class TestPebbleService:
             WORKLOAD_CONTAINER, mocked_layer, combine=True
         )
         restart.assert_called_once()
+        mocked_container.remove_path.assert_called_once_with(CONFIG_FILE_NAME, recursive=True)
+
+    @patch("ops.pebble.Layer")
+    def test_plan_failure_when_adding_layer(
+        self,
+        mocked_layer: MagicMock,
+        mocked_container: MagicMock,
+        pebble_service: PebbleService,
+    ) -> None:
+        mocked_container.add_layer.side_effect = Exception
+
+        with pytest.raises(PebbleServiceError):
+            pebble_service.plan(mocked_layer)
+
+        mocked_container.restart.assert_not_called()
+        mocked_container.remove_path.assert_called_once_with(CONFIG_FILE_NAME, recursive=True)
+
+    @patch("ops.pebble.Layer")
+    def test_plan_failure_when_config_file_removal_fails(
+        self,
+        mocked_layer: MagicMock,
+        mocked_container: MagicMock,
+        pebble_service: PebbleService,
+    ) -> None:
+        mocked_container.restart.side_effect = Exception
+        mocked_container.remove_path.side_effect = Exception
+
+        with pytest.raises(PebbleServiceError):
+            pebble_service.plan(mocked_layer)
+
+        mocked_container.remove_path.assert_called_once_with(CONFIG_FILE_NAME, recursive=True)
+
+    @pytest.mark.parametrize("failed_call", ["add_layer", "restart"])
+    def test_push_config_file_again_after_failed_plan(
+        self, harness: Harness, failed_call: str
+    ) -> None:
+        pebble_service = PebbleService(harness.charm.unit)
+        container = harness.charm.unit.get_container(WORKLOAD_CONTAINER)
+
+        assert pebble_service.push_config_file("config") is True
+        with (
+            patch.object(container, failed_call, side_effect=Exception),
+            pytest.raises(PebbleServiceError),
+        ):
+            pebble_service.plan(Layer(PEBBLE_LAYER_DICT))
+
+        assert pebble_service.push_config_file("config") is True
 
     def test_render_pebble_layer(self, pebble_service: PebbleService) -> None:
         data_source = MagicMock(spec=EnvVarConvertible)
@@ -148,3 +246,26 @@ class TestPebbleService:
         layer = pebble_service.render_pebble_layer(data_source, another_data_source)
 
         assert layer.to_dict()["services"][WORKLOAD_SERVICE]["environment"] == expected
+
+    def test_render_pebble_layer_with_overlapping_env_vars(
+        self, pebble_service: PebbleService
+    ) -> None:
+        data_source = MagicMock(spec=EnvVarConvertible)
+        data_source.to_env_vars.return_value = {"key": "value"}
+
+        another_data_source = MagicMock(spec=EnvVarConvertible)
+        another_data_source.to_env_vars.return_value = {"key": "overridden"}
+
+        layer = pebble_service.render_pebble_layer(data_source, another_data_source)
+
+        assert layer.to_dict()["services"][WORKLOAD_SERVICE]["environment"]["key"] == "value"
+
+    def test_render_pebble_layer_keeps_skeleton_intact(
+        self, pebble_service: PebbleService
+    ) -> None:
+        data_source = MagicMock(spec=EnvVarConvertible)
+        data_source.to_env_vars.return_value = {"key1": "value1"}
+
+        pebble_service.render_pebble_layer(data_source)
+
+        assert "environment" not in PEBBLE_LAYER_DICT["services"][WORKLOAD_SERVICE]